@@ -1,14 +1,18 @@
 from __future__ import annotations  
 
+import bisect
 import random
 import time
 import tkinter as tk
 from tkinter import messagebox
-from typing import Tuple
+from typing import List, Tuple
 
 DIFFICULTY_BOUNDS = {1: ("Easy", 1, 9), 2: ("Moderate", 10, 99), 3: ("Advanced", 1000, 9999)}
 TOTAL_QUESTIONS = 10
 PTS_FIRST, PTS_SECOND = 10, 5
+_OPS = ("+", "-")  # operator pool, indexed by a single random bit
+_CUTS = (50, 60, 70, 80, 90)  # lower bound (inclusive) of each grade above F
+_GRADES = ("F", "D", "C", "B", "A", "A+")
 BG_COLOR = "#000000"
 FG_COLOR = "#FFFFFF"
 ENTRY_BG = "#111111"
@@ -21,17 +25,7 @@ SELECT_COLOR = "#242424"
 # -----------------------------------------------------------------------------
 def rank_from_percentage(pct: int) -> str:
     """Map percentage to letter grade (criterion-referenced thresholding)."""
-    if pct >= 90:
-        return "A+"
-    if pct >= 80:
-        return "A"
-    if pct >= 70:
-        return "B"
-    if pct >= 60:
-        return "C"
-    if pct >= 50:
-        return "D"
-    return "F"
+    return _GRADES[bisect.bisect_right(_CUTS, pct)]
 
 
 def compute(a: int, op: str, b: int) -> int:
@@ -39,6 +33,22 @@ def compute(a: int, op: str, b: int) -> int:
     return a + b if op == "+" else a - b
 
 
+def generateItems(level: int, n: int = TOTAL_QUESTIONS) -> List[Tuple[int, str, int]]:
+    """
+    Build the whole item bank for one play up front from randomInt and
+    decideOperation, so next_question only has to index into it.
+    For Easy/Moderate, operands are swapped so subtraction never goes negative.
+    """
+    items = []
+    for _ in range(n):
+        a, b = randomInt(level)
+        op = decideOperation()
+        if op == "-" and level != 3 and a < b:
+            a, b = b, a
+        items.append((a, op, b))
+    return items
+
+
 # =============================================================================
 # Required interface functions 
 # -----------------------------------------------------------------------------
@@ -57,7 +67,7 @@ def randomInt(level: int) -> Tuple[int, int]:
 
 def decideOperation() -> str:
     """Randomly pick '+' or '-' (ensures item variety)."""
-    return random.choice(["+", "-"])
+    return _OPS[random.getrandbits(1)]
 
 
 def displayProblem(app: "QuizApp", a: int, op: str, b: int, *, clear_feedback: bool = True) -> None:
@@ -136,6 +146,7 @@ class QuizApp:
         self.a = 0
         self.b = 0
         self.op = "+"
+        self.items: List[Tuple[int, str, int]] = []  # pre-generated (a, op, b) per question
 
         # ---- Observable UI variables (data binding to labels/entries) ----
         self.var_question = tk.StringVar(value="")
@@ -220,6 +231,7 @@ class QuizApp:
         """Initialize a run: set level, reset state, timestamp, then pose Q1."""
         self.level = int(self.var_level.get())
         self.reset_for_new_play()
+        self.items = generateItems(self.level)
         self.menu.pack_forget()
         self.quiz.pack(fill="both", expand=True)
         self.start_time = time.perf_counter()
@@ -239,21 +251,15 @@ class QuizApp:
 
     def next_question(self) -> None:
         """
-        Advance the item index, generate a new problem, and render it.
-        For Easy/Moderate, disallow negative results to maintain approachability.
+        Advance the item index, fetch the next precomputed problem, and render it.
+        The bank is generated once per play in start_quiz (see generateItems).
         """
         self.q_index += 1
         if self.q_index > TOTAL_QUESTIONS:
             displayResults(self)
             return
 
-        a, b = randomInt(self.level)
-        op = decideOperation()
-
-        # Keep early levels approachable: prevent negatives for Easy/Moderate
-        if op == "-" and self.level != 3 and a < b:
-            a, b = b, a
-
+        a, op, b = self.items[self.q_index - 1]
         self.a, self.b, self.op = a, b, op
         self.attempt = 1
         self.var_progress.set(f"Q{self.q_index}/{TOTAL_QUESTIONS}")
@@ -1,4 +1,4 @@
-import tkinter as tk, random
+import tkinter as tk, random, pickle
 from pathlib import Path
 
 PHRASE = "alexa tell me a joke"               # The exact phrase the user must type (we compare in lowercase)
@@ -6,7 +6,17 @@ PHRASE = "alexa tell me a joke"               # The exact phrase the user must t
 def load_jokes():
     base = Path(__file__).resolve().parent if "__file__" in globals() else Path().resolve()
     p = base / "randomJokes.txt"              # Expects the dataset file in the same folder as this script
+    cache = base / "randomJokes.pkl"          # Parsed jokes, reused while newer than the text file
     jokes = []
+    if p.exists() and cache.exists() and cache.stat().st_mtime >= p.stat().st_mtime:
+        try:
+            with cache.open("rb") as f:
+                jokes = pickle.load(f)
+        except Exception:
+            jokes = []                        # Corrupt/unreadable/foreign cache: fall through and re-parse
+        if isinstance(jokes, list) and jokes and all(isinstance(j, tuple) and len(j) == 2 for j in jokes):
+            return jokes
+        jokes = []
     if p.exists():
         # Read file line by line; each line should be "setup?Punchline"
         for line in p.read_text(encoding="utf-8", errors="ignore").splitlines():
@@ -15,6 +25,11 @@ def load_jokes():
                 continue
             s, pl = line.split("?", 1)
             jokes.append((s.strip() + "?", pl.strip()))
+        try:
+            with cache.open("wb") as f:
+                pickle.dump(jokes, f, protocol=5)
+        except OSError:
+            pass                              # Read-only folder: just skip caching
     if jokes:
         return jokes
     # Fallback joke so the app still runs even if the file is missing
@@ -1,29 +1,34 @@
 from __future__ import annotations
+import csv
 import tkinter as tk
-from tkinter import ttk, messagebox, simpledialog
+from bisect import bisect_right
+from tkinter import ttk, messagebox
 from pathlib import Path
-from dataclasses import dataclass
-from typing import List, Tuple, Optional
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, List, Tuple, Optional
 
 # -------------------------- paths --------------------------
+@lru_cache(maxsize=1)                                        # script folder is fixed; resolve() it only once
 def data_path() -> Path:
     base = Path(__file__).resolve().parent if "__file__" in globals() else Path().resolve()
     return base / "studentMarks.txt"
 
 # -------------------------- model --------------------------
-@dataclass
+_CUTS = (40, 50, 60, 70); _GRADES = ("F", "D", "C", "B", "A")                        # grade boundaries on overall %
+
+@dataclass(frozen=True)
 class Student:
     code: int; name: str; cw1: int; cw2: int; cw3: int; exam: int
-    @property
-    def cw_total(self) -> int: return self.cw1 + self.cw2 + self.cw3                 # /60
-    @property
-    def total(self) -> int: return self.cw_total + self.exam                          # /160
-    @property
-    def percent(self) -> float: return (self.total / 160) * 100.0
-    @property
-    def grade(self) -> str:
-        p = self.percent
-        return "A" if p >= 70 else "B" if p >= 60 else "C" if p >= 50 else "D" if p >= 40 else "F"
+    # Derived marks are computed once here; records are immutable, so they never go stale
+    cw_total: int = field(init=False, repr=False, compare=False)                      # /60
+    total: int = field(init=False, repr=False, compare=False)                         # /160
+    percent: float = field(init=False, repr=False, compare=False)
+    grade: str = field(init=False, repr=False, compare=False)
+    def __post_init__(self) -> None:
+        cw = self.cw1 + self.cw2 + self.cw3; tot = cw + self.exam; p = (tot / 160) * 100.0
+        g = _GRADES[bisect_right(_CUTS, p)]
+        for k, v in (("cw_total", cw), ("total", tot), ("percent", p), ("grade", g)): object.__setattr__(self, k, v)
 
 # -------------------------- file I/O -----------------------
 def load_students() -> List[Student]:
@@ -32,26 +37,24 @@ def load_students() -> List[Student]:
         messagebox.showerror("File Missing", f"Could not find {p.name} in the script folder.")
         return []
     rows: List[Student] = []
-    for i, line in enumerate(p.read_text(encoding="utf-8", errors="ignore").splitlines()):
-        line = line.strip()
-        if not line: continue
-        if i == 0 and line.isdigit() and "," not in line:  # leading count line
-            continue
-        parts = [x.strip() for x in line.split(",")]
-        if len(parts) != 6: continue
-        try:
-            code = int(parts[0]); name = parts[1]
-            c1, c2, c3, ex = map(int, parts[2:])
-        except ValueError:
-            continue
-        rows.append(Student(code, name, c1, c2, c3, ex))
+    with p.open(encoding="utf-8", errors="ignore", newline="") as f:
+        for row in csv.reader(f):                     # one C-level pass; blank lines come back as []
+            if len(row) != 6: continue                # also skips the leading count line
+            try:
+                code = int(row[0]); name = row[1].strip()
+                c1, c2, c3, ex = map(int, row[2:6])   # int() tolerates surrounding whitespace
+            except ValueError:
+                continue
+            rows.append(Student(code, name, c1, c2, c3, ex))
     return rows
 
 def save_students(students: List[Student]) -> None:
     """Persist to file and include the leading count line as per brief."""
     p = data_path()
-    lines = [str(len(students))] + [f"{s.code},{s.name},{s.cw1},{s.cw2},{s.cw3},{s.exam}" for s in students]
-    p.write_text("\n".join(lines), encoding="utf-8")
+    with p.open("w", encoding="utf-8", newline="") as f:     # stream rows; no big joined string in memory
+        w = csv.writer(f, lineterminator="\n")                # quotes names with commas so load_students reads them back
+        w.writerow([len(students)])
+        w.writerows((s.code, s.name, s.cw1, s.cw2, s.cw3, s.exam) for s in students)
 
 # -------------------------- utils -------------------------
 def fmt_percent(p: float) -> str: return f"{p:.1f}%"
@@ -63,6 +66,7 @@ class StudentManagerApp:
     def __init__(self, root: tk.Tk) -> None:
         self.root = root; self.root.title("Student Manager — Coursework + Exam (out of 160)")
         self.students: List[Student] = load_students()
+        self._by_code: Dict[int, int] = {}; self._reindex()          # code -> index into self.students
         root.geometry("900x520"); root.minsize(820, 480)
 
         # Left menu / Right content
@@ -94,6 +98,9 @@ class StudentManagerApp:
         self.status = tk.Label(self.right, fg="#FFFFFF")
         self.status.pack(anchor="w", pady=(4,0))
 
+        # One hidden prompt window, reused by _ask/_confirm instead of a fresh dialog per question
+        self._build_prompt()
+
         # Do NOT auto-populate. Show instruction until user clicks "View all".
         self._set_status("Click 'View all student records' to display the list.")
 
@@ -105,7 +112,7 @@ class StudentManagerApp:
 
     def view_individual(self) -> None:
         if not self.students: return messagebox.showinfo("No Data", "No student records loaded.")
-        query = simpledialog.askstring("Find Student", "Enter student code or part of name:")
+        query = self._ask("Find Student", "Enter student code or part of name:")
         if not query: return
         query = query.strip().lower(); found = []
         for s in self.students:
@@ -128,15 +135,16 @@ class StudentManagerApp:
 
     def sort_records(self) -> None:
         if not self.students: return
-        asc = messagebox.askyesno("Sort", "Sort by overall % ascending?\n(Yes=Ascending, No=Descending)")
-        self.students.sort(key=lambda s: s.percent, reverse=not asc)
+        asc = self._confirm("Sort", "Sort by overall % ascending?\n(Yes=Ascending, No=Descending)")
+        self.students.sort(key=lambda s: s.percent, reverse=not asc); self._reindex()
         self.view_all()
 
     def add_student(self) -> None:
         s = self._edit_dialog(title="Add Student")
         if not s: return
-        if any(st.code == s.code for st in self.students):
+        if s.code in self._by_code:
             return messagebox.showerror("Duplicate", f"Student code {s.code} already exists.")
+        self._by_code[s.code] = len(self.students)
         self.students.append(s); save_students(self.students)
         messagebox.showinfo("Added", f"Added {s.name} ({s.code}).")
         self.view_all()
@@ -145,8 +153,8 @@ class StudentManagerApp:
         if not self.students: return
         s = self._choose_from_list(self.students, "Delete Student")
         if not s: return
-        if not messagebox.askyesno("Confirm Delete", f"Delete {s.name} ({s.code})?"): return
-        self.students = [x for x in self.students if x.code != s.code]; save_students(self.students)
+        if not self._confirm("Confirm Delete", f"Delete {s.name} ({s.code})?"): return
+        del self.students[self._index_of(s)]; self._reindex(); save_students(self.students)
         messagebox.showinfo("Deleted", f"Deleted {s.name} ({s.code}).")
         self.view_all()
 
@@ -156,10 +164,10 @@ class StudentManagerApp:
         if not s0: return
         s = self._edit_dialog(s0, "Update Student")
         if not s: return
-        if s.code != s0.code and any(st.code == s.code for st in self.students):
+        if s.code != s0.code and s.code in self._by_code:
             return messagebox.showerror("Duplicate", f"Student code {s.code} already exists.")
-        for i, st in enumerate(self.students):
-            if st.code == s0.code: self.students[i] = s; break
+        self.students[self._index_of(s0)] = s
+        if s.code != s0.code: self._reindex()
         save_students(self.students)
         messagebox.showinfo("Updated", f"Updated {s.name} ({s.code}).")
         self.view_all()
@@ -167,9 +175,19 @@ class StudentManagerApp:
     # ---------- helpers ----------
     def _add_button(self, text, cmd): tk.Button(self.left, text=text, width=26, command=cmd).pack(anchor="w", pady=2)
 
+    def _reindex(self) -> None: self._by_code = {s.code: i for i, s in enumerate(self.students)}
+
+    def _index_of(self, s: Student) -> int:
+        # The file may hold duplicate codes and _by_code keeps only the last; fall back to an identity scan
+        i = self._by_code.get(s.code)
+        return i if i is not None and self.students[i] is s else next(j for j, x in enumerate(self.students) if x is s)
+
     def _fill_table(self, records: List[Student]) -> None:
-        for row in self.tree.get_children(): self.tree.delete(row)
-        for s in records: self.tree.insert("", "end", values=student_to_row(s))
+        rows = [student_to_row(s) for s in records]
+        self.tree.pack_forget()                                         # defer geometry work until all rows are in
+        self.tree.delete(*self.tree.get_children())
+        for r in rows: self.tree.insert("", "end", values=r)
+        self.tree.pack(fill="both", expand=True, before=self.status)    # keep it above the status line
 
     def _set_status(self, text: str) -> None: self.status.config(text=text)
 
@@ -177,6 +195,45 @@ class StudentManagerApp:
         return (f"Name: {s.name} · Number: {s.code} · CW: {s.cw_total}/60 · "
                 f"Exam: {s.exam}/100 · Overall: {fmt_percent(s.percent)} · Grade: {s.grade}")
 
+    def _build_prompt(self) -> None:
+        win = self._prompt_win = tk.Toplevel(self.root); win.withdraw(); win.transient(self.root); win.resizable(False, False)
+        self._prompt_label = tk.Label(win, justify="left", wraplength=320); self._prompt_label.pack(padx=10, pady=(10,6), anchor="w")
+        self._prompt_entry = tk.Entry(win, width=36)
+        self._prompt_btns = tk.Frame(win); self._prompt_btns.pack(pady=8)
+        self._prompt_yes = tk.Button(self._prompt_btns, width=10, command=lambda: self._close_prompt(True))
+        self._prompt_no = tk.Button(self._prompt_btns, width=10, command=lambda: self._close_prompt(False))
+        self._prompt_yes.pack(side="left", padx=5); self._prompt_no.pack(side="left", padx=5)
+        self._prompt_done = tk.BooleanVar(win, value=False)
+        win.protocol("WM_DELETE_WINDOW", lambda: self._close_prompt(False))
+        win.bind("<Return>", lambda e: self._prompt_return()); win.bind("<Escape>", lambda e: self._close_prompt(False))
+        # If the app is closed while a prompt is open, release the wait instead of hanging in tkwait
+        win.bind("<Destroy>", lambda e: self._prompt_done.set(False) if e.widget is win else None)
+
+    def _prompt_return(self) -> None:
+        # Like the native dialogs, Enter presses the focused button (so Tab to "No" + Enter means No)
+        w = self._prompt_win.focus_get()
+        if isinstance(w, tk.Button): w.invoke()
+        else: self._close_prompt(True)
+
+    def _close_prompt(self, ok: bool) -> None:
+        self._prompt_win.grab_release(); self._prompt_win.withdraw(); self.root.focus_set(); self._prompt_done.set(ok)
+
+    def _show_prompt(self, title: str, prompt: str, with_entry: bool) -> bool:
+        """Reconfigure the pooled prompt window, show it modally, and return True on OK/Yes."""
+        win = self._prompt_win; win.title(title); self._prompt_label.config(text=prompt)
+        self._prompt_entry.delete(0, "end")
+        if with_entry: self._prompt_entry.pack(padx=10, pady=(0,4), before=self._prompt_btns)
+        else: self._prompt_entry.pack_forget()
+        self._prompt_yes.config(text="OK" if with_entry else "Yes"); self._prompt_no.config(text="Cancel" if with_entry else "No")
+        win.deiconify(); win.lift(); win.grab_set()
+        (self._prompt_entry if with_entry else self._prompt_yes).focus_set()
+        win.wait_variable(self._prompt_done); return self._prompt_done.get()
+
+    def _ask(self, title: str, prompt: str) -> Optional[str]:
+        return self._prompt_entry.get() if self._show_prompt(title, prompt, True) else None
+
+    def _confirm(self, title: str, prompt: str) -> bool: return self._show_prompt(title, prompt, False)
+
     def _choose_from_list(self, options: List[Student], title: str) -> Optional[Student]:
         win = tk.Toplevel(self.root); win.title(title); win.transient(self.root); win.grab_set()
         tk.Label(win, text=title, font=("Segoe UI", 11, "bold")).pack(padx=10, pady=(10,6))